@@ -6,12 +6,75 @@ Since:
     05/10/2022
 """
 
+import io
 import json
+import os
+import re
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
-from uuid import uuid4
+from uuid import UUID
 import hashlib
+import zlib
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+try:
+    # Prefer orjson for JSON parsing/serialization (several times faster on large payloads).
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_UUID_PATTERN = re.compile(r'[0-9a-f-]+\Z')
+""" Matches the characters a stringified UUID may contain. """
+
+
+_S3_POINTER_PREFIX = '["com.amazon.sqs.javamessaging.MessageS3Pointer"'
+""" The exact prefix every serialized S3 pointer starts with. """
+
+
+_STR_HAS_ISASCII = hasattr(str, 'isascii')
+""" Whether str.isascii is available (Python 3.7+); older interpreters fall back to encoding. """
+
+
+try:
+    # This MD5 is only ever a checksum, never a security primitive. Declaring that (Python 3.9+)
+    # permits faster non-FIPS implementations and keeps the client usable on FIPS-restricted hosts.
+    hashlib.md5(usedforsecurity=False)
+
+    def _new_md5():
+        return hashlib.md5(usedforsecurity=False)
+except TypeError:
+    _new_md5 = hashlib.md5
+
+
+def _json_dumps(value: Any) -> bytes:
+    """ Serializes a value as JSON-encoded bytes, using orjson if available.
+
+    Args:
+        value (Any): The value to serialize.
+    Returns:
+        bytes: The JSON-encoded (UTF-8) bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode('utf-8')
+
+
+def _json_loads(value: str) -> Any:
+    """ Parses a JSON document, using orjson if available.
+
+    Args:
+        value (str): The JSON document to parse.
+    Returns:
+        Any: The parsed value.
+    """
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
 
 
 class BigSqsClient():
@@ -24,13 +87,53 @@ class BigSqsClient():
     """
 
 
+    S3_POOL_SIZE = 10
+    """ The maximum number of concurrent S3 operations performed per client.
+    """
+
+
+    SQS_BATCH_SIZE = 10
+    """ The maximum number of entries permitted in a single SQS batch API call.
+    """
+
+
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    """ The payload size (in bytes) above which S3 uploads switch to concurrent multipart transfer.
+    """
+
+
+    UUID_POOL_SIZE = 256
+    """ The number of UUIDs generated per entropy read when refilling the client's UUID pool.
+    """
+
+
+    RECEIPT_HANDLE_LOOKUP_LIMIT = 100_000
+    """ The maximum number of S3 pointers tracked against receipt handles before eviction.
+    """
+
+
+    S3_DELETE_BATCH_SIZE = 1000
+    """ The maximum number of keys permitted in a single S3 DeleteObjects call.
+    """
+
+
+    MAX_POOL_CONNECTIONS = 64
+    """ The HTTPS connection pool size for clients built by the factory methods. Sized well above
+    the client's combined S3/SQS concurrency so that parallel transfers don't contend on pool
+    checkout (the boto3 default of 10 would cap them). Callers constructing their own boto3
+    clients should size max_pool_connections similarly.
+    """
+
+
     def __init__(
         self,
         sqs: Any,
         s3: Any,
         queue_url: str,
         bucket_name: str,
-        size_threshold: int=MAX_SQS_MESSAGE_SIZE):
+        size_threshold: int=MAX_SQS_MESSAGE_SIZE,
+        compress_oversize: bool=False,
+        assume_small: bool=False):
         """ Initializes a new SQS client capable of storing oversize message payloads on S3.
 
         Args:
@@ -39,13 +142,41 @@ class BigSqsClient():
             queue_url (str): The URL of the queue to connect to.
             bucket_name (str): The name of the S3 bucket to use to store overside message payloads.
             size_threshold (int): The size limit (in bytes) above which S3 should be used to store message payloads.
+            compress_oversize (bool): Whether to compress oversize payloads before storing them on S3
+                (text typically compresses several times over, cutting transfer time and storage).
+                Compressed payloads are decompressed transparently on receive, but consumers not
+                using this client will see the compressed bytes, so this defaults to off.
+            assume_small (bool): Whether the caller guarantees every message fits within the size
+                threshold. When set, send_message skips the size check and S3 codepath entirely;
+                oversize messages will be rejected by SQS rather than diverted to S3.
         """
         self._sqs = sqs
         self._s3 = s3
         self._queue_url = queue_url
         self._bucket_name = bucket_name
         self._size_threshold = size_threshold
-        self._receipt_handle_lookup = {}
+        self._compress_oversize = compress_oversize
+        self._receipt_handle_lookup = OrderedDict()
+        self._s3_executor = None
+        self._uuid_pool = deque()
+        self._recv_buffer = deque()
+
+        # Pointer JSON differs only by key between sends, so build it from a template with the
+        # bucket name escaped once per client rather than re-serializing a dict per oversize send.
+        # The template stays str rather than bytes: the SQS model types MessageBody as String, so
+        # botocore's parameter validation rejects bytes bodies. Bucket names are ASCII-constrained,
+        # making the cheaper ASCII decode safe here.
+        self._pointer_template = (
+            _S3_POINTER_PREFIX
+            + ',{"s3BucketName":'
+            + _json_dumps(bucket_name).decode('ascii')
+            + ',"s3Key":"%s"}]'
+        )
+
+        # Producers that guarantee small messages get a specialized send_message with the size
+        # check and S3 branch partially evaluated away, bound at construction time.
+        if assume_small:
+            self.send_message = self._send_message_small
 
 
     @staticmethod
@@ -57,9 +188,84 @@ class BigSqsClient():
         Returns:
             int: The length of the string in bytes when encoded as UTF-8.
         """
+
+        # For pure-ASCII strings (the common case) byte length equals character length, and the
+        # ASCII check is O(1) on CPython, so we can skip materializing an encoded copy entirely.
+        if _STR_HAS_ISASCII and message.isascii():
+            return len(message)
         return len(message.encode('utf-8'))
 
 
+    def _upload_oversize_payload(self, message: str, payload_id: str) -> str:
+        """ Uploads an oversize message payload to S3, returning the S3 pointer to send in its place.
+
+        Args:
+            message (str): The oversize message payload to upload.
+            payload_id (str): The unique ID to store the payload under.
+        Returns:
+            str: The S3 pointer to use as the SQS message body.
+        """
+
+        data = message.encode('utf-8')
+        extra_args = {'ContentType': 'text/plain'}
+
+        # Optionally compress before upload. zlib format is the HTTP 'deflate' content-coding;
+        # level 3 trades a little ratio for speed.
+        if self._compress_oversize:
+            data = zlib.compress(data, 3)
+            extra_args['ContentEncoding'] = 'deflate'
+
+        # Very large payloads go up as a chunked multipart transfer, which bounds the buffered
+        # memory to (chunk size x concurrency) and parallelizes within the single upload.
+        if len(data) > BigSqsClient.MULTIPART_THRESHOLD:
+            self._s3.upload_fileobj(
+                io.BytesIO(data),
+                self._bucket_name,
+                payload_id,
+                ExtraArgs=extra_args,
+                Config=TransferConfig(
+                    multipart_threshold=BigSqsClient.MULTIPART_THRESHOLD,
+                    multipart_chunksize=BigSqsClient.MULTIPART_THRESHOLD,
+                    max_concurrency=4,
+                ),
+            )
+        else:
+            self._s3.put_object(
+                Body=data,
+                Bucket=self._bucket_name,
+                Key=payload_id,
+                **extra_args,
+            )
+        # Payload IDs are stringified UUIDs (hex digits and dashes), so they are JSON-safe to
+        # substitute into the template without escaping.
+        assert _UUID_PATTERN.match(payload_id)
+        return self._pointer_template % payload_id
+
+
+    def _send_message_small(
+        self,
+        message: str,
+        attributes: Dict[str, Any] = None,
+        message_group_id: Optional[str] = None) -> Dict[str, Any]:
+        """ Sends an SQS message known to fit within the size threshold (see assume_small).
+
+        Args:
+            message (str): The message to send.
+            attributes (Dict[str, Any]): Any attributes to attach to the message.
+            message_group_id (Optional[str]): The message group ID to attach to the message (defaults to a new UUID).
+        Returns:
+            Dict[str, Any]: The response from SQS.
+        """
+        payload_id = str(self._next_uuid())
+        return self._sqs.send_message(
+            QueueUrl=self._queue_url,
+            MessageDeduplicationId=payload_id,
+            MessageGroupId=message_group_id if message_group_id is not None else str(self._next_uuid()),
+            MessageAttributes=attributes if attributes is not None else {},
+            MessageBody=message
+        )
+
+
     def send_message(
         self,
         message: str,
@@ -76,37 +282,46 @@ class BigSqsClient():
         """
 
         # Create a unique ID. Start off by assuming our message is the SQS payload.
-        payload_id = str(uuid4())
+        payload_id = str(self._next_uuid())
         payload = message
 
-        # If we exceed the size threshold, we'll need to make use of S3.
-        if BigSqsClient.utf8len(message) > self._size_threshold:
+        # If we exceed the size threshold, we'll need to make use of S3. UTF-8 encodes at most 4
+        # bytes per character, so obviously-small messages skip the byte-length check entirely.
+        if len(message) * 4 > self._size_threshold and BigSqsClient.utf8len(message) > self._size_threshold:
 
             # Upload to S3 and substitute out payload for pointer.
-            self._s3.put_object(
-                Body=message,
-                Bucket=self._bucket_name,
-                Key=payload_id,
-                ContentType='text/plain',
-            )
-            payload = json.dumps([
-                'com.amazon.sqs.javamessaging.MessageS3Pointer',
-                {
-                    's3BucketName': self._bucket_name,
-                    's3Key': payload_id,
-                },
-            ])
+            payload = self._upload_oversize_payload(message, payload_id)
 
         # Finally send message to SQS.
         return self._sqs.send_message(
             QueueUrl=self._queue_url,
             MessageDeduplicationId=payload_id,
-            MessageGroupId=message_group_id if message_group_id is not None else str(uuid4()),
+            MessageGroupId=message_group_id if message_group_id is not None else str(self._next_uuid()),
             MessageAttributes=attributes if attributes is not None else {},
             MessageBody=payload
         )
 
 
+    @staticmethod
+    def _attributes_size(attributes: Dict[str, Any]) -> int:
+        """ Estimates the number of bytes a set of message attributes counts toward SQS size limits.
+
+        SQS counts attribute names, data types and values toward the 256 KiB message (and batch)
+        limit alongside the message body.
+
+        Args:
+            attributes (Dict[str, Any]): The message attributes to measure.
+        Returns:
+            int: The approximate size of the attributes in bytes.
+        """
+        size = 0
+        for name, attribute in attributes.items():
+            size += BigSqsClient.utf8len(name)
+            for value in attribute.values():
+                size += len(value) if isinstance(value, bytes) else BigSqsClient.utf8len(str(value))
+        return size
+
+
     def send_messages(
         self,
         messages: List[Tuple[str, Dict[str, Any], str]]) -> List[Dict[str, Any]]:
@@ -115,90 +330,329 @@ class BigSqsClient():
         Args:
             messages (List[Tuple[str, Dict[str, Any], str]]): The messages to send as (payload, attrs, id) tuples.
         Returns:
-            List[Dict[str, Any]]: The responses from SQS.
+            List[Dict[str, Any]]: The responses from SQS, in the same order as the input messages.
         """
-        return list(map(lambda message: self.send_message(*message), messages))
+
+        if not messages:
+            return []
+
+        # Transpose the (payload, attributes, group ID) tuples into parallel columns. The size
+        # check, UUID assignment and entry construction below then run as tight single-column
+        # loops rather than re-unpacking tuples per message.
+        normalized = [(tuple(message) + (None, None))[:3] for message in messages]
+        payloads, attributes_column, group_id_column = (list(column) for column in zip(*normalized))
+
+        # Create a unique ID per message and identify oversize payloads needing S3 upload.
+        sizes = [
+            len(payload) if _STR_HAS_ISASCII and payload.isascii() else len(payload.encode('utf-8'))
+            for payload in payloads
+        ]
+        payload_ids = [str(self._next_uuid()) for _ in payloads]
+        oversize = [index for index, size in enumerate(sizes) if size > self._size_threshold]
+
+        # Upload oversize payloads to S3 concurrently, substituting pointers (independent I/O).
+        if oversize:
+            executor = self._get_s3_executor()
+            pointers = executor.map(
+                lambda index: self._upload_oversize_payload(payloads[index], payload_ids[index]),
+                oversize,
+            )
+            for index, pointer in zip(oversize, pointers):
+                payloads[index] = pointer
+                sizes[index] = len(pointer) # Pointer JSON is pure ASCII.
+
+        # Build a batch entry for each message, as in send_message.
+        entries = [
+            {
+                'Id': str(index),
+                'MessageBody': payloads[index],
+                'MessageDeduplicationId': payload_ids[index],
+                'MessageGroupId': group_id_column[index] if group_id_column[index] is not None else str(self._next_uuid()),
+                'MessageAttributes': attributes_column[index] if attributes_column[index] is not None else {},
+            }
+            for index in range(len(payloads))
+        ]
+
+        # Chunk entries into batches. SQS caps a SendMessageBatch call at 10 entries AND at 256 KiB
+        # of cumulative payload (bodies plus attributes, the same limit as a single message), so we
+        # split on whichever is hit first; an entry near the limit by itself goes in its own batch.
+        batches = []
+        batch, batch_bytes = [], 0
+        for index, entry in enumerate(entries):
+            entry_bytes = sizes[index] + BigSqsClient._attributes_size(entry['MessageAttributes'])
+            if batch and (len(batch) >= BigSqsClient.SQS_BATCH_SIZE
+                or batch_bytes + entry_bytes > BigSqsClient.MAX_SQS_MESSAGE_SIZE):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(entry)
+            batch_bytes += entry_bytes
+        batches.append(batch)
+
+        # Send the batches, merging results back into input order.
+        responses = [None] * len(entries)
+        for batch in batches:
+            batch_response = self._sqs.send_message_batch(
+                QueueUrl=self._queue_url,
+                Entries=batch,
+            )
+            for result in batch_response.get('Successful', []) + batch_response.get('Failed', []):
+                responses[int(result['Id'])] = result
+        return responses
+
+
+    def _record_receipt_handle(self, receipt_handle: str, s3_bucket_name: str, s3_key: str):
+        """ Records an S3 pointer against a receipt handle, for cleanup when the message is deleted.
+
+        The lookup is LRU-bounded so that long-running consumers that occasionally drop receipts
+        (and so never delete the corresponding entries) don't leak memory without bound.
+
+        Args:
+            receipt_handle (str): The receipt handle of the message the pointer arrived in.
+            s3_bucket_name (str): The name of the S3 bucket holding the oversize payload.
+            s3_key (str): The key of the S3 object holding the oversize payload.
+        """
+        self._receipt_handle_lookup[receipt_handle] = {
+            's3_bucket_name': s3_bucket_name,
+            's3_key': s3_key,
+        }
+        self._receipt_handle_lookup.move_to_end(receipt_handle)
+        while len(self._receipt_handle_lookup) > BigSqsClient.RECEIPT_HANDLE_LOOKUP_LIMIT:
+            self._receipt_handle_lookup.popitem(last=False)
+
+
+    def _next_uuid(self) -> UUID:
+        """ Gets a random (version 4) UUID from the client's pool, refilling the pool if empty.
+
+        Pooling amortizes the os.urandom syscall over many UUIDs: one entropy read serves 256
+        UUIDs rather than one syscall each.
+
+        Returns:
+            UUID: A random UUID.
+        """
+        if not self._uuid_pool:
+            buffer = os.urandom(16 * BigSqsClient.UUID_POOL_SIZE)
+            for offset in range(0, len(buffer), 16):
+                self._uuid_pool.append(UUID(bytes=buffer[offset:offset + 16], version=4))
+        return self._uuid_pool.popleft()
+
+
+    def _get_s3_executor(self) -> ThreadPoolExecutor:
+        """ Gets the thread pool used for concurrent S3 operations, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The thread pool to submit S3 operations to.
+        """
+        if self._s3_executor is None:
+            self._s3_executor = ThreadPoolExecutor(max_workers=BigSqsClient.S3_POOL_SIZE)
+        return self._s3_executor
 
 
     @staticmethod
-    def is_s3_pointer(message: Dict[str, Any]) -> bool:
-        """ Gets whether or not the given SQS message is an S3 pointer.
+    def _finalize_s3_payload(content_encoding: Optional[str], body_bytes: bytes, body_hash: Any) -> Tuple[bytes, str]:
+        """ Finalizes a fetched payload, transparently decompressing it if it was stored compressed.
 
         Args:
-            message (Dict[str, Any]): The message to check.
+            content_encoding (Optional[str]): The ContentEncoding the payload was stored with, if any.
+            body_bytes (bytes): The raw payload bytes as fetched from S3.
+            body_hash (Any): The MD5 hash accumulated over the raw bytes while streaming.
         Returns:
-            bool: True if the message in an S3 pointer, otherwise False.
+            Tuple[bytes, str]: The payload bytes to hand back and their MD5 hash as a hex digest.
+        """
+        if content_encoding in ('deflate', 'gzip'):
+
+            # The wbits offset makes zlib auto-detect the zlib and gzip framings. MD5OfBody must
+            # reflect the decompressed body we hand back, so rehash.
+            body_bytes = zlib.decompress(body_bytes, zlib.MAX_WBITS | 32)
+            body_hash = _new_md5()
+            body_hash.update(body_bytes)
+        return body_bytes, body_hash.hexdigest()
+
+
+    def _fetch_s3_payload(self, s3_bucket_name: str, s3_key: str) -> Tuple[bytes, str]:
+        """ Fetches an oversize message payload from S3, hashing it as it streams in.
+
+        Args:
+            s3_bucket_name (str): The name of the S3 bucket to fetch the payload from.
+            s3_key (str): The key of the S3 object holding the payload.
+        Returns:
+            Tuple[bytes, str]: The raw payload bytes and their MD5 hash as a hex digest.
+        """
+
+        # Fetch the first range. For payloads within the threshold this is the whole object in a
+        # single round-trip; for larger ones the Content-Range header tells us the total size.
+        chunk_size = BigSqsClient.MULTIPART_THRESHOLD
+        s3_response = self._s3.get_object(
+            Bucket=s3_bucket_name,
+            Key=s3_key,
+            Range=f'bytes=0-{chunk_size - 1}',
+        )
+
+        # Read in 64 KiB chunks, hashing as we go. This overlaps hashing with network I/O (MD5
+        # releases the GIL for inputs over 2 KiB) rather than making a second pass over the bytes.
+        body_hash = _new_md5()
+        chunks = []
+        for chunk in iter(lambda: s3_response['Body'].read(65536), b''):
+            body_hash.update(chunk)
+            chunks.append(chunk)
+        first_chunk = b''.join(chunks)
+        content_length = int(s3_response['ContentRange'].rsplit('/', 1)[-1]) \
+            if 'ContentRange' in s3_response else len(first_chunk)
+        if content_length <= len(first_chunk):
+            return BigSqsClient._finalize_s3_payload(s3_response.get('ContentEncoding'), first_chunk, body_hash)
+
+        # Fetch the remaining ranges concurrently (throughput on a single connection is capped well
+        # below S3's per-object limits). A short-lived pool is used here rather than the shared S3
+        # pool, as this method may itself be running on a shared pool worker.
+        ranges = [
+            (start, min(start + chunk_size, content_length) - 1)
+            for start in range(chunk_size, content_length, chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=min(8, len(ranges))) as range_executor:
+            parts = list(range_executor.map(
+                lambda byte_range: self._s3.get_object(
+                    Bucket=s3_bucket_name,
+                    Key=s3_key,
+                    Range=f'bytes={byte_range[0]}-{byte_range[1]}',
+                )['Body'].read(),
+                ranges,
+            ))
+        for part in parts:
+            body_hash.update(part)
+        return BigSqsClient._finalize_s3_payload(
+            s3_response.get('ContentEncoding'),
+            first_chunk + b''.join(parts),
+            body_hash,
+        )
+
+
+    @staticmethod
+    def _try_parse_s3_pointer(body: str) -> Optional[Tuple[str, str]]:
+        """ Attempts to parse an SQS message body as an S3 pointer, in a single JSON parse.
+
+        Args:
+            body (str): The message body to parse.
+        Returns:
+            Optional[Tuple[str, str]]: The (bucket name, key) pair if the body is an S3 pointer, otherwise None.
         """
 
-        # Capture message body. We need to determine if this represents an S3 pointer.
-        body = message['Body']
+        # Every serialized pointer starts with the same prefix, so a constant-cost string
+        # comparison rules out ordinary message bodies without paying for a JSON parse.
+        if not body.startswith(_S3_POINTER_PREFIX):
+            return None
         try:
 
             # Attempt to parse as JSON.
-            parsed_body = json.loads(body)
+            parsed_body = _json_loads(body)
 
             # We should have a 2-list consisting of a Java fully-qualified type name and S3 pointer.
-            return type(parsed_body) is list and len(parsed_body) == 2 \
+            if type(parsed_body) is list and len(parsed_body) == 2 \
                 and parsed_body[0] == 'com.amazon.sqs.javamessaging.MessageS3Pointer' \
                 and type(parsed_body[1]) is dict \
-                and 's3BucketName' in parsed_body[1] and 's3Key' in parsed_body[1]
-        except json.JSONDecodeError:
+                and 's3BucketName' in parsed_body[1] and 's3Key' in parsed_body[1]:
+                return (parsed_body[1]['s3BucketName'], parsed_body[1]['s3Key'])
+        except ValueError: # Covers both json.JSONDecodeError and orjson.JSONDecodeError.
 
             # Can't parse as JSON. If this fails, this is not an S3 pointer.
-            return False
+            pass
+        return None
 
 
-    def receive_messages(
-        self,
-        max_number_of_messages: int,
-        attributes: Optional[List[str]]=None) -> Dict[str, Any]:
-        """ Receives one or more messages from SQS, resolving any pointers to oversize payloads on S3.
+    @staticmethod
+    def is_s3_pointer(message: Dict[str, Any]) -> bool:
+        """ Gets whether or not the given SQS message is an S3 pointer.
 
         Args:
-            max_number_of_messages (Optional[int]): The maximum number of messages to receive (defaults to 1).
-            attributes (Optional[List[str]]): The attributes to return with the message (defaults to all).
+            message (Dict[str, Any]): The message to check.
         Returns:
-            Dict[str, Any]: The response from SQS, with oversize payloads resolved via S3.
+            bool: True if the message in an S3 pointer, otherwise False.
         """
+        return BigSqsClient._try_parse_s3_pointer(message['Body']) is not None
 
-        # Query SQS.
-        sqs_response = self._sqs.receive_message(
-            QueueUrl=self._queue_url,
-            MaxNumberOfMessages=max_number_of_messages,
-            MessageAttributeNames=['All'] if attributes is None else attributes,
-            WaitTimeSeconds=20,
-        )
 
-        # Go through each message in the response and resolve any S3 pointers.
-        for message in sqs_response.get('Messages', []):
+    def _resolve_s3_pointers(self, messages: List[Dict[str, Any]]):
+        """ Resolves any S3 pointers among the given SQS messages, in place.
+
+        Args:
+            messages (List[Dict[str, Any]]): The SQS messages to resolve pointers in.
+        """
+
+        # Go through each message and collect any S3 pointers for resolution.
+        pointers = []
+        for message in messages:
 
-            # If the message is an S3 pointer, attempt to resolve it.
-            if BigSqsClient.is_s3_pointer(message):
+            # If the message is an S3 pointer, queue it up for resolution.
+            s3_pointer = BigSqsClient._try_parse_s3_pointer(message['Body'])
+            if s3_pointer is not None:
 
-                # Destructure pointer.
-                body = json.loads(message['Body'])
-                s3_bucket_name = body[1]['s3BucketName']
-                s3_key = body[1]['s3Key']
+                # Destructure pointer (already parsed, no second JSON pass needed).
+                s3_bucket_name, s3_key = s3_pointer
 
                 # Record pointer against receipt handle, for when we delete.
-                self._receipt_handle_lookup[message['ReceiptHandle']] = {
-                    's3_bucket_name': s3_bucket_name,
-                    's3_key': s3_key,
-                }
-
-                # Pull in oversize payload from S3 and assign in place of SQS message body.
-                s3_response = self._s3.get_object(Bucket=s3_bucket_name, Key=s3_key)
-                body_bytes = s3_response['Body'].read()
+                self._record_receipt_handle(message['ReceiptHandle'], s3_bucket_name, s3_key)
+                pointers.append((message, s3_bucket_name, s3_key))
+
+        # Resolve all pointers concurrently (the blocking S3 reads are independent I/O).
+        if pointers:
+            executor = self._get_s3_executor()
+            payloads = executor.map(
+                lambda pointer: self._fetch_s3_payload(pointer[1], pointer[2]),
+                pointers,
+            )
+
+            # Pull in oversize payloads from S3 and assign in place of SQS message bodies.
+            for (message, _, _), (body_bytes, body_md5) in zip(pointers, payloads):
                 message['Body'] = body_bytes.decode('utf-8')
-                message['MD5OfBody'] = hashlib.md5(body_bytes).hexdigest() # Update MD5 hash.
+                message['MD5OfBody'] = body_md5 # Update MD5 hash (computed while streaming).
 
-                # Correct content length.
-                content_length = int(sqs_response['ResponseMetadata']['HTTPHeaders']['content-length'])
-                new_content_length = len(json.dumps(sqs_response))
-                new_content_length += len(str(new_content_length)) - len(str(content_length))
-                sqs_response['ResponseMetadata']['HTTPHeaders']['content-length'] = str(new_content_length)
 
-        # Return response with S3 pointers resolved.
+    def receive_messages(
+        self,
+        max_number_of_messages: int,
+        attributes: Optional[List[str]]=None) -> Dict[str, Any]:
+        """ Receives one or more messages from SQS, resolving any pointers to oversize payloads on S3.
+
+        Messages are prefetched in full batches of 10 (the SQS maximum) into an internal buffer and
+        served from there, so callers that consume messages one at a time still amortize the SQS
+        round-trip across up to 10 messages. Note that buffered messages remain subject to the
+        queue's visibility timeout while they wait to be served.
+
+        Args:
+            max_number_of_messages (Optional[int]): The maximum number of messages to receive (defaults to 1).
+            attributes (Optional[List[str]]): The attributes to return with the message (defaults to all).
+        Returns:
+            Dict[str, Any]: The response from SQS, with oversize payloads resolved via S3.
+        """
+
+        # Top up the prefetch buffer with full batches until we can satisfy the caller (or the
+        # queue has nothing more to give us).
+        sqs_response = {}
+        while len(self._recv_buffer) < max_number_of_messages:
+            sqs_response = self._sqs.receive_message(
+                QueueUrl=self._queue_url,
+                MaxNumberOfMessages=BigSqsClient.SQS_BATCH_SIZE,
+                MessageAttributeNames=['All'] if attributes is None else attributes,
+                WaitTimeSeconds=20,
+            )
+            messages = sqs_response.get('Messages', [])
+            if not messages:
+                break
+            self._resolve_s3_pointers(messages)
+            self._recv_buffer.extend(messages)
+
+        # The content-length header describes the wire response, not the resolved and buffered
+        # payloads we serve. Recomputing it would mean re-serializing the response, so drop it.
+        if 'ResponseMetadata' in sqs_response:
+            sqs_response['ResponseMetadata'].get('HTTPHeaders', {}).pop('content-length', None)
+
+        # Serve the caller from the front of the buffer, preserving arrival order.
+        served = [
+            self._recv_buffer.popleft()
+            for _ in range(min(max_number_of_messages, len(self._recv_buffer)))
+        ]
+        if served:
+            sqs_response['Messages'] = served
+        else:
+            sqs_response.pop('Messages', None)
         return sqs_response
 
 
@@ -218,8 +672,8 @@ class BigSqsClient():
         )
 
         # Look up whether or not we have an S3 pointer on record for this receipt handle and delete if so.
-        if receipt_handle in self._receipt_handle_lookup:
-            s3_pointer = self._receipt_handle_lookup[receipt_handle]
+        s3_pointer = self._receipt_handle_lookup.pop(receipt_handle, None)
+        if s3_pointer is not None:
             self._s3.delete_object(
                 Bucket=s3_pointer['s3_bucket_name'],
                 Key=s3_pointer['s3_key'],
@@ -227,6 +681,65 @@ class BigSqsClient():
         return sqs_response
 
 
+    def delete_messages(self, receipt_handles: List[str]) -> List[Dict[str, Any]]:
+        """ Deletes multiple SQS messages from the queue, cleaning up their associated S3 objects if necessary.
+
+        Deletes are batched: up to 10 receipts per SQS DeleteMessageBatch call and up to 1000 keys
+        per S3 DeleteObjects call, rather than one API call per message.
+
+        Args:
+            receipt_handles (List[str]): The receipt handles of the messages to delete.
+        Returns:
+            List[Dict[str, Any]]: The responses from SQS, one per DeleteMessageBatch call.
+        """
+
+        # Delete the messages on SQS in batches of 10 (the SQS limit).
+        sqs_responses = []
+        for offset in range(0, len(receipt_handles), BigSqsClient.SQS_BATCH_SIZE):
+            group = receipt_handles[offset:offset + BigSqsClient.SQS_BATCH_SIZE]
+            sqs_responses.append(self._sqs.delete_message_batch(
+                QueueUrl=self._queue_url,
+                Entries=[
+                    {'Id': str(index), 'ReceiptHandle': receipt_handle}
+                    for index, receipt_handle in enumerate(group)
+                ],
+            ))
+
+        # Collect any S3 pointers we have on record for these receipts into per-bucket key lists.
+        keys_by_bucket = {}
+        for receipt_handle in receipt_handles:
+            s3_pointer = self._receipt_handle_lookup.pop(receipt_handle, None)
+            if s3_pointer is not None:
+                keys_by_bucket.setdefault(s3_pointer['s3_bucket_name'], []).append(s3_pointer['s3_key'])
+
+        # Bulk-delete the S3 objects, up to 1000 keys per call.
+        for bucket_name, keys in keys_by_bucket.items():
+            for offset in range(0, len(keys), BigSqsClient.S3_DELETE_BATCH_SIZE):
+                self._s3.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={
+                        'Objects': [
+                            {'Key': key}
+                            for key in keys[offset:offset + BigSqsClient.S3_DELETE_BATCH_SIZE]
+                        ],
+                    },
+                )
+        return sqs_responses
+
+
+    @staticmethod
+    def _boto_config() -> Config:
+        """ Builds the botocore configuration used for clients created by the factory methods.
+
+        Returns:
+            Config: A configuration with an enlarged connection pool and adaptive retries.
+        """
+        return Config(
+            max_pool_connections=BigSqsClient.MAX_POOL_CONNECTIONS,
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+        )
+
+
     @staticmethod
     def from_aws_creds(
         region_name: str,
@@ -234,7 +747,8 @@ class BigSqsClient():
         aws_secret_access_key: str,
         queue_url: str,
         bucket_name: str,
-        size_threshold: int=MAX_SQS_MESSAGE_SIZE) -> 'BigSqsClient':
+        size_threshold: int=MAX_SQS_MESSAGE_SIZE,
+        compress_oversize: bool=False) -> 'BigSqsClient':
         """ Initializes a new SQS client capable of handling large messages, using the given AWS credentials.
 
         Args:
@@ -244,25 +758,30 @@ class BigSqsClient():
             queue_url (str): The URL of the queue to connect to.
             bucket_name (str): The name of the S3 bucket to use to store overside message payloads.
             size_threshold (int): The size limit (in bytes) above which S3 should be used to store message payloads.
+            compress_oversize (bool): Whether to compress oversize payloads before storing them on S3.
         Returns:
             BigSqsClient: The newly-initialized client.
         """
+        config = BigSqsClient._boto_config()
         return BigSqsClient(
             boto3.client(
                 'sqs',
                 region_name=region_name,
                 aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key
+                aws_secret_access_key=aws_secret_access_key,
+                config=config,
             ),
             boto3.client(
                 's3',
                 region_name=region_name,
                 aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key
+                aws_secret_access_key=aws_secret_access_key,
+                config=config,
             ),
             queue_url,
             bucket_name,
             size_threshold,
+            compress_oversize,
         )
 
 
@@ -270,7 +789,8 @@ class BigSqsClient():
     def from_default_aws_creds(
         queue_url: str,
         bucket_name: str,
-        size_threshold: int=MAX_SQS_MESSAGE_SIZE) -> 'BigSqsClient':
+        size_threshold: int=MAX_SQS_MESSAGE_SIZE,
+        compress_oversize: bool=False) -> 'BigSqsClient':
         """ Initializes a new SQS client capable of handling large messages, from the default AWS credentials present
         in the environment.
 
@@ -278,7 +798,16 @@ class BigSqsClient():
             queue_url (str): The URL of the queue to connect to.
             bucket_name (str): The name of the S3 bucket to use to store overside message payloads.
             size_threshold (int): The size limit (in bytes) above which S3 should be used to store message payloads.
+            compress_oversize (bool): Whether to compress oversize payloads before storing them on S3.
         Returns:
             BigSqsClient: The newly-initialized client.
         """
-        return BigSqsClient(boto3.client('sqs'), boto3.client('s3'), queue_url, bucket_name, size_threshold)
+        config = BigSqsClient._boto_config()
+        return BigSqsClient(
+            boto3.client('sqs', config=config),
+            boto3.client('s3', config=config),
+            queue_url,
+            bucket_name,
+            size_threshold,
+            compress_oversize,
+        )